@@ -1,6 +1,7 @@
 import math
 from typing import Tuple
 
+import numpy as np
 import pyproj
 from pyproj import Transformer
 from scipy.spatial.transform import Rotation
@@ -43,6 +44,22 @@ def wgs84_to_tile_coord(lat: float, lon: float, zoom: int) -> Tuple[int, int]:
     return int(x), int(y)
 
 
+def wgs84_to_tile_coords(points: np.ndarray, zoom: int) -> np.ndarray:
+    """
+    Converts multiple WGS84 coordinates to XYZ coordinates at once.
+
+    :param points: An array of shape (n, 2) containing latitude/longitude pairs.
+    :param zoom: Z coordinate.
+    :return: An array of shape (n, 2) containing the X and Y coordinates.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    lat_rad = np.radians(points[:, 0])
+    scale = 1 << zoom
+    x = (points[:, 1] + 180.0) / 360.0 * scale
+    y = (1.0 - np.arcsinh(np.tan(lat_rad)) / np.pi) / 2.0 * scale
+    return np.column_stack((x.astype(int), y.astype(int)))
+
+
 def wgs84_to_isn93(lat: float, lon: float) -> Tuple[float, float]:
     """
     Converts WGS84 coordinates to ISN93 coordinates.
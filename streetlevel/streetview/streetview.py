@@ -1,9 +1,19 @@
+import aiohttp
 from aiohttp import ClientSession
+import asyncio
+import httpx
+import functools
 import itertools
-import math
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+import numpy as np
 from PIL import Image, UnidentifiedImageError
 from requests import Session
+from requests.adapters import HTTPAdapter, Retry
 import requests
 from typing import List, Optional, Tuple
 from io import BytesIO
@@ -14,8 +24,42 @@ from .panorama import StreetViewPanorama
 from .parse import parse_coverage_tile_response, parse_panorama_id_response, \
     parse_panorama_radius_response
 from .util import is_third_party_panoid
-from ..geo import wgs84_to_tile_coord
-from ..util import get_equirectangular_panorama_async
+from ..geo import wgs84_to_tile_coord, wgs84_to_tile_coords
+
+logger = logging.getLogger(__name__)
+
+_TILE_RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+_MAX_TILE_WORKERS = 8
+_TILE_CLIENT_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+
+class _TTLCache:
+    """A small dict-based cache whose entries expire after a fixed time."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = {}
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        added_at, value = entry
+        if time.monotonic() - added_at >= self.ttl:
+            # pop() rather than del: another thread may have expired it already.
+            self._entries.pop(key, None)
+            return default
+        return value
+
+    def set(self, key, value) -> None:
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            # Evict the oldest entry; dicts preserve insertion order.
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic(), value)
+
+_metadata_cache = _TTLCache(maxsize=10_000, ttl=3600.0)
+# Sentinel distinguishing a cache miss from a cached "no panorama found" (None).
+_MISS = object()
 
 def find_panorama(lat: float, lon: float, radius: int = 50, locale: str = "en",
                   search_third_party: bool = False, session: Session = None) -> Optional[StreetViewPanorama]:
@@ -31,16 +75,34 @@ def find_panorama(lat: float, lon: float, radius: int = 50, locale: str = "en",
       rather than official ones. Defaults to false.
     :param session: *(optional)* A requests session.
     :return: A StreetViewPanorama object if a panorama was found, or None.
+
+    Results are cached for an hour.
     """
+    cache_key = _radius_search_cache_key(lat, lon, radius, locale, search_third_party)
+    pano = _metadata_cache.get(cache_key, _MISS)
+    if pano is not _MISS:
+        return pano
     response = api.find_panorama(lat, lon, radius=radius, download_depth=False,
                                  locale=locale, search_third_party=search_third_party, session=session)
-    return parse_panorama_radius_response(response)
+    pano = parse_panorama_radius_response(response)
+    _metadata_cache.set(cache_key, pano)
+    return pano
 
 async def find_panorama_async(lat: float, lon: float, session: ClientSession, radius: int = 50,
                               locale: str = "en", search_third_party: bool = False) -> Optional[StreetViewPanorama]:
+    cache_key = _radius_search_cache_key(lat, lon, radius, locale, search_third_party)
+    pano = _metadata_cache.get(cache_key, _MISS)
+    if pano is not _MISS:
+        return pano
     response = await api.find_panorama_async(lat, lon, session, radius=radius, download_depth=False,
                                              locale=locale, search_third_party=search_third_party)
-    return parse_panorama_radius_response(response)
+    pano = parse_panorama_radius_response(response)
+    _metadata_cache.set(cache_key, pano)
+    return pano
+
+def _radius_search_cache_key(lat: float, lon: float, radius: int, locale: str, search_third_party: bool) -> tuple:
+    # ~1e-5 degrees is about a meter, far below any sensible search radius.
+    return round(lat, 5), round(lon, 5), radius, locale, search_third_party
 
 def find_panorama_by_id(panoid: str, download_depth: bool = False, locale: str = "en",
                         session: Session = None) -> Optional[StreetViewPanorama]:
@@ -52,16 +114,30 @@ def find_panorama_by_id(panoid: str, download_depth: bool = False, locale: str =
     :param locale: Desired language of the location's address as IETF code.
     :param session: *(optional)* A requests session.
     :return: A StreetViewPanorama object if a panorama with this ID exists, or None.
+
+    Results are cached for an hour.
     """
+    cache_key = (panoid, download_depth, locale)
+    pano = _metadata_cache.get(cache_key, _MISS)
+    if pano is not _MISS:
+        return pano
     response = api.find_panorama_by_id(panoid, download_depth=download_depth,
                                        locale=locale, session=session)
-    return parse_panorama_id_response(response)
+    pano = parse_panorama_id_response(response)
+    _metadata_cache.set(cache_key, pano)
+    return pano
 
 async def find_panorama_by_id_async(panoid: str, session: ClientSession, download_depth: bool = False,
                                     locale: str = "en") -> Optional[StreetViewPanorama]:
+    cache_key = (panoid, download_depth, locale)
+    pano = _metadata_cache.get(cache_key, _MISS)
+    if pano is not _MISS:
+        return pano
     response = await api.find_panorama_by_id_async(panoid, session,
                                                    download_depth=download_depth, locale=locale)
-    return parse_panorama_id_response(response)
+    pano = parse_panorama_id_response(response)
+    _metadata_cache.set(cache_key, pano)
+    return pano
 
 def get_coverage_tile(tile_x: int, tile_y: int, session: Session = None) -> List[StreetViewPanorama]:
     """
@@ -97,6 +173,61 @@ async def get_coverage_tile_by_latlon_async(lat: float, lon: float, session: Cli
     tile_coord = wgs84_to_tile_coord(lat, lon, 17)
     return await get_coverage_tile_async(tile_coord[0], tile_coord[1], session)
 
+def get_coverage_tiles_by_latlons(points: List[Tuple[float, float]]) -> List[List[StreetViewPanorama]]:
+    """
+    Same as :func:`get_coverage_tile_by_latlon <get_coverage_tile_by_latlon>`, but for many points at once.
+    Points which fall on the same tile only cause one request, and the unique tiles are fetched concurrently.
+
+    :param points: A list of latitude/longitude pairs.
+    :return: For each input point, a list of StreetViewPanoramas on the tile that point falls on.
+    """
+    async def run() -> List[List[StreetViewPanorama]]:
+        async with ClientSession() as session:
+            return await get_coverage_tiles_by_latlons_async(points, session)
+
+    return asyncio.run(run())
+
+async def get_coverage_tiles_by_latlons_async(points: List[Tuple[float, float]],
+                                              session: ClientSession) -> List[List[StreetViewPanorama]]:
+    tile_coords = wgs84_to_tile_coords(np.asarray(points, dtype=float), 17)
+    unique_coords = np.unique(tile_coords, axis=0)
+    fetches = [_get_coverage_tile_with_retries(int(x), int(y), session) for x, y in unique_coords]
+    if hasattr(asyncio, "TaskGroup"):  # Python 3.11+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(fetch) for fetch in fetches]
+        results = [task.result() for task in tasks]
+    else:
+        results = await asyncio.gather(*fetches)
+    panos_by_tile = {(int(x), int(y)): panos for (x, y), panos in zip(unique_coords, results)}
+    return [panos_by_tile[(int(x), int(y))] for x, y in tile_coords]
+
+_COVERAGE_TILE_ATTEMPTS = 3
+
+async def _get_coverage_tile_with_retries(tile_x: int, tile_y: int,
+                                          session: ClientSession) -> List[StreetViewPanorama]:
+    """
+    Fetches one coverage tile, retrying transient failures with exponential backoff
+    so one flaky tile does not take down a whole batch. Returns an empty list if
+    every attempt failed.
+    """
+    url = api.build_coverage_tile_request_url(tile_x, tile_y)
+    for attempt in range(_COVERAGE_TILE_ATTEMPTS):
+        delay = 0.3 * 2 ** attempt
+        try:
+            async with session.get(url) as response:
+                if response.status == 200:
+                    text = await response.text()
+                    return parse_coverage_tile_response(json.loads(text[4:]))
+                retry_after = response.headers.get("Retry-After")
+                if response.status == 429 and retry_after and retry_after.isdigit():
+                    delay = int(retry_after)
+        except (aiohttp.ClientError, json.JSONDecodeError):
+            pass
+        if attempt + 1 < _COVERAGE_TILE_ATTEMPTS:
+            await asyncio.sleep(delay)
+    logger.warning("Failed to fetch coverage tile (%d, %d)", tile_x, tile_y)
+    return []
+
 def download_panorama(pano: StreetViewPanorama, path: str, zoom: int = 5, pil_args: dict = None) -> None:
     """
     Downloads a panorama to a file.
@@ -112,7 +243,7 @@ def download_panorama(pano: StreetViewPanorama, path: str, zoom: int = 5, pil_ar
     if image:
         image.save(path, **pil_args)
     else:
-        print(f"Failed to download panorama {pano.id}")
+        logger.warning("Failed to download panorama %s", pano.id)
 
 async def download_panorama_async(pano: StreetViewPanorama, path: str, session: ClientSession,
                                   zoom: int = 5, pil_args: dict = None) -> None:
@@ -122,7 +253,7 @@ async def download_panorama_async(pano: StreetViewPanorama, path: str, session:
     if image:
         image.save(path, **pil_args)
     else:
-        print(f"Failed to download panorama {pano.id}")
+        logger.warning("Failed to download panorama %s", pano.id)
 
 def get_panorama(pano: StreetViewPanorama, zoom: int = 5, session: Optional[requests.Session] = None) -> Optional[Image.Image]:
     """
@@ -142,27 +273,65 @@ def _get_panorama_with_sizes(pano: StreetViewPanorama, zoom: int, session: Optio
     zoom = max(0, min(zoom, len(pano.image_sizes) - 1))
     img_size = pano.image_sizes[zoom]
     tiles = _generate_tile_list(pano.id, zoom, (img_size.x, img_size.y))
-    try:
-        return get_equirectangular_panorama(img_size.x, img_size.y, pano.tile_size, tiles)
-    except UnidentifiedImageError:
-        print(f"Failed to download panorama {pano.id} at zoom level {zoom}")
-        return None
+    image = _download_and_stitch(tiles, img_size.x, img_size.y, pano.tile_size, session)
+    if image is None:
+        logger.warning("Failed to download panorama %s at zoom level %d", pano.id, zoom)
+    return image
 
 def _get_panorama_without_sizes(pano: StreetViewPanorama, zoom: int, session: Optional[requests.Session]) -> Optional[Image.Image]:
-    ZOOM_LEVELS = range(zoom, -1, -1)  # From requested zoom to lowest (0)
     TILE_SIZE = Size(512, 512)  # Assuming a fixed tile size
 
-    for test_zoom in ZOOM_LEVELS:
-        img_size = _calculate_image_size(test_zoom)
-        tiles = _generate_tile_list(pano.id, test_zoom, img_size)
+    # Find the highest available zoom with cheap single-tile probes
+    # rather than downloading a full set of tiles per candidate zoom.
+    highest_zoom = _find_highest_zoom(pano.id, session)
+    if highest_zoom is None:
+        logger.warning("Failed to download panorama %s at any zoom level", pano.id)
+        return None
 
-        tile_images = _download_tiles(tiles, session)
-        if tile_images:
-            return get_equirectangular_panorama(img_size[0], img_size[1], TILE_SIZE, tiles)
+    zoom = min(zoom, highest_zoom)
+    img_size = _calculate_image_size(zoom)
+    tiles = _generate_tile_list(pano.id, zoom, img_size)
+    image = _download_and_stitch(tiles, img_size[0], img_size[1], TILE_SIZE, session)
+    if image is None:
+        logger.warning("Failed to download panorama %s at zoom level %d", pano.id, zoom)
+    return image
+
+_MAX_ZOOM = 5
+# Known zooms are kept for an hour; panoramas with no tiles at all are only
+# cached briefly so they are eventually re-probed.
+_highest_zoom_cache = _TTLCache(maxsize=4096, ttl=3600.0)
+_unavailable_cache = _TTLCache(maxsize=4096, ttl=60.0)
+
+def _find_highest_zoom(panoid: str, session: Optional[requests.Session] = None,
+                       max_zoom: int = _MAX_ZOOM) -> Optional[int]:
+    """
+    Returns the highest zoom level at which tiles of a panorama are available,
+    or None if no zoom level returned a tile. Results are cached per pano ID;
+    unavailable panoramas are only cached for a short time.
+    """
+    cached_zoom = _highest_zoom_cache.get(panoid)
+    if cached_zoom is not None:
+        return min(cached_zoom, max_zoom)
+    if _unavailable_cache.get(panoid):
+        return None
 
-    print(f"Failed to download panorama {pano.id} at any zoom level")
+    if session is None:
+        session = _get_default_session()
+    for test_zoom in range(max_zoom, -1, -1):
+        # HEAD returns the same status code as GET on the tile endpoints,
+        # but without transferring the tile body.
+        try:
+            response = session.head(_generate_tile_url(panoid, test_zoom, 0, 0),
+                                    timeout=5, allow_redirects=True)
+        except requests.RequestException:
+            continue
+        if response.status_code == 200:
+            _highest_zoom_cache.set(panoid, test_zoom)
+            return test_zoom
+    _unavailable_cache.set(panoid, True)
     return None
 
+@functools.lru_cache(maxsize=16)
 def _calculate_image_size(zoom: int) -> Tuple[int, int]:
     """Calculate the image size based on zoom level."""
     base_width, base_height = 416, 208  # Size at zoom level 0
@@ -172,34 +341,92 @@ def _calculate_image_size(zoom: int) -> Tuple[int, int]:
 def _generate_tile_list(panoid: str, zoom: int, img_size: Tuple[int, int]) -> List[Tile]:
     """Generate a list of tiles for the panorama."""
     tile_width, tile_height = 512, 512  # Assuming fixed tile size
-    cols = -(-img_size[0] // tile_width)  # Ceiling division
-    rows = -(-img_size[1] // tile_height)
+    cols = (img_size[0] + tile_width - 1) // tile_width  # Ceiling division
+    rows = (img_size[1] + tile_height - 1) // tile_height
 
-    tiles = []
-    for x in range(cols):
-        for y in range(rows):
-            url = _generate_tile_url(panoid, zoom, x, y)
-            tiles.append(Tile(x, y, url))
+    # Resolve the third-party check and the URL template once rather than per tile.
+    url_template = _tile_url_template(panoid, zoom)
+    return [Tile(x, y, url_template.format(x=x, y=y))
+            for x, y in itertools.product(range(cols), range(rows))]
 
-    return tiles
+def _tile_url_template(panoid: str, zoom: int) -> str:
+    """Generate a tile URL template with ``{x}`` and ``{y}`` placeholders."""
+    if is_third_party_panoid(panoid):
+        return f"https://lh3.ggpht.com/p/{panoid}=x{{x}}-y{{y}}-z{zoom}"
+    else:
+        return f"https://cbk0.google.com/cbk?output=tile&panoid={panoid}&zoom={zoom}&x={{x}}&y={{y}}"
 
 def _generate_tile_url(panoid: str, zoom: int, x: int, y: int) -> str:
     """Generate the URL for a specific tile."""
-    if is_third_party_panoid(panoid):
-        return f"https://lh3.ggpht.com/p/{panoid}=x{x}-y{y}-z{zoom}"
-    else:
-        return f"https://cbk0.google.com/cbk?output=tile&panoid={panoid}&zoom={zoom}&x={x}&y={y}"
+    return _tile_url_template(panoid, zoom).format(x=x, y=y)
+
+def _build_tile_session() -> requests.Session:
+    """Create a session whose connection pool is sized for parallel tile downloads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_TILE_RETRIES)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+_default_session: Optional[requests.Session] = None
+
+def _get_default_session() -> requests.Session:
+    """Return the shared keep-alive session used when the caller does not pass one."""
+    global _default_session
+    if _default_session is None:
+        _default_session = _build_tile_session()
+    return _default_session
 
 def _download_tiles(tiles: List[Tile], session: Optional[requests.Session]) -> Optional[dict]:
-    """Download all tiles and return them as a dictionary."""
+    """Download all tiles concurrently and return them as a dictionary of ``bytes``."""
+    if session is None:
+        session = _get_default_session()
+
+    def fetch(tile: Tile) -> bytes:
+        response = session.get(tile.url, timeout=10)
+        response.raise_for_status()
+        return response.content
+
+    tile_bytes = {}
+    with ThreadPoolExecutor(max_workers=_MAX_TILE_WORKERS) as executor:
+        futures = [(tile, executor.submit(fetch, tile)) for tile in tiles]
+        for tile, future in futures:
+            try:
+                tile_bytes[(tile.x, tile.y)] = future.result()
+            except requests.RequestException:
+                logger.warning("Failed to download tile at %s", tile.url)
+                return None
+    return tile_bytes
+
+_image_executor: Optional[ProcessPoolExecutor] = None
+
+def _get_image_executor() -> ProcessPoolExecutor:
+    """Return the shared process pool used for decoding tile images."""
+    global _image_executor
+    if _image_executor is None:
+        _image_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _image_executor
+
+def _decode_tile(data: bytes) -> Image.Image:
+    image = Image.open(BytesIO(data))
+    # Ask libjpeg to decode straight to RGB at native size so no
+    # colorspace post-conversion is needed.
+    image.draft('RGB', image.size)
+    image.load()
+    return image
+
+def _decode_tiles(tile_bytes: Optional[dict]) -> Optional[dict]:
+    """Decode downloaded tiles into PIL images on the process pool."""
+    if tile_bytes is None:
+        return None
+    executor = _get_image_executor()
     tile_images = {}
-    for tile in tiles:
+    futures = [(coord, executor.submit(_decode_tile, data)) for coord, data in tile_bytes.items()]
+    for coord, future in futures:
         try:
-            response = session.get(tile.url) if session else requests.get(tile.url)
-            response.raise_for_status()
-            tile_images[(tile.x, tile.y)] = Image.open(BytesIO(response.content))
-        except (requests.RequestException, UnidentifiedImageError):
-            print(f"Failed to download tile at {tile.url}")
+            tile_images[coord] = future.result()
+        except UnidentifiedImageError:
+            logger.warning("Failed to decode tile %s", coord)
             return None
     return tile_images
 
@@ -213,18 +440,127 @@ def get_equirectangular_panorama(width: int, height: int, tile_size: Size, tiles
     :param tiles: The tiles this panorama is made of.
     :return: The stitched panorama as PIL image.
     """
-    panorama = Image.new('RGB', (width, height))
-    tile_images = _download_tiles(tiles, None)  # We're not using a session here
-    
-    if tile_images is None:
+    image = _download_and_stitch(tiles, width, height, tile_size, None)
+    if image is None:
         raise UnidentifiedImageError("Failed to download one or more tiles")
+    return image
+
+def _download_and_stitch(tiles: List[Tile], width: int, height: int, tile_size: Size,
+                         session: Optional[requests.Session]) -> Optional[Image.Image]:
+    """Download, decode and stitch a tile list, or return None if any tile failed."""
+    tile_images = _decode_tiles(_download_tiles(tiles, session))
+    if tile_images is None:
+        return None
+    return _stitch_tiles(tile_images, tiles, width, height, tile_size)
 
+def _stitch_tiles(tile_images: dict, tiles: List[Tile], width: int, height: int, tile_size: Size) -> Image.Image:
+    """Copy downloaded tiles into a preallocated canvas and return it as a full panorama."""
+    # zeros, not empty: a short tile must leave black pixels, not garbage.
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
     for tile in tiles:
         tile_image = tile_images[(tile.x, tile.y)]
-        panorama.paste(tile_image, (tile.x * tile_size.x, tile.y * tile_size.y))
+        if tile_image.mode != 'RGB':
+            tile_image = tile_image.convert('RGB')
+        tile_array = np.asarray(tile_image)
+        x0 = tile.x * tile_size.x
+        y0 = tile.y * tile_size.y
+        # Tiles past the right/bottom edge are padded; crop them to the canvas.
+        tile_height = min(tile_array.shape[0], height - y0)
+        tile_width = min(tile_array.shape[1], width - x0)
+        canvas[y0:y0 + tile_height, x0:x0 + tile_width] = tile_array[:tile_height, :tile_width]
+    return Image.fromarray(canvas)
+
+async def _download_tiles_async(tiles: List[Tile]) -> Optional[dict]:
+    """Download all tiles multiplexed over HTTP/2 and return them as a dictionary."""
+
+    async def fetch(client: httpx.AsyncClient, tile: Tile) -> Optional[bytes]:
+        try:
+            response = await client.get(tile.url, timeout=10)
+            response.raise_for_status()
+            return response.content
+        except httpx.HTTPError:
+            logger.warning("Failed to download tile at %s", tile.url)
+            return None
+
+    # The tile endpoints speak HTTP/2, so a handful of connections can
+    # multiplex all requests without per-request TCP/TLS setup.
+    async with httpx.AsyncClient(http2=True, limits=_TILE_CLIENT_LIMITS) as client:
+        files = await asyncio.gather(*(fetch(client, tile) for tile in tiles))
+    if any(data is None for data in files):
+        return None
 
-    return panorama
+    loop = asyncio.get_running_loop()
+    executor = _get_image_executor()
+    decode_futures = [(tile, loop.run_in_executor(executor, _decode_tile, data))
+                      for tile, data in zip(tiles, files)]
+    tile_images = {}
+    for tile, future in decode_futures:
+        try:
+            tile_images[(tile.x, tile.y)] = await future
+        except UnidentifiedImageError:
+            logger.warning("Failed to decode tile at %s", tile.url)
+            return None
+    return tile_images
 
 async def get_panorama_async(pano: StreetViewPanorama, session: ClientSession, zoom: int = 5) -> Optional[Image.Image]:
-    # Implementation for async version...
-    pass  # Placeholder for async implementation
+    # ``session`` is kept for API consistency with the other async functions,
+    # but tiles are fetched over HTTP/2 through an internal httpx client.
+    if pano.image_sizes:
+        return await _get_panorama_with_sizes_async(pano, zoom)
+    else:
+        return await _get_panorama_without_sizes_async(pano, zoom)
+
+async def _get_panorama_with_sizes_async(pano: StreetViewPanorama, zoom: int) -> Optional[Image.Image]:
+    zoom = max(0, min(zoom, len(pano.image_sizes) - 1))
+    img_size = pano.image_sizes[zoom]
+    tiles = _generate_tile_list(pano.id, zoom, (img_size.x, img_size.y))
+    tile_images = await _download_tiles_async(tiles)
+    if tile_images is None:
+        logger.warning("Failed to download panorama %s at zoom level %d", pano.id, zoom)
+        return None
+    return _stitch_tiles(tile_images, tiles, img_size.x, img_size.y, pano.tile_size)
+
+async def _get_panorama_without_sizes_async(pano: StreetViewPanorama, zoom: int) -> Optional[Image.Image]:
+    highest_zoom = await _find_highest_zoom_async(pano.id)
+    if highest_zoom is None:
+        logger.warning("Failed to download panorama %s at any zoom level", pano.id)
+        return None
+
+    zoom = min(zoom, highest_zoom)
+    img_size = _calculate_image_size(zoom)
+    tiles = _generate_tile_list(pano.id, zoom, img_size)
+    tile_images = await _download_tiles_async(tiles)
+    if tile_images is None:
+        logger.warning("Failed to download panorama %s at zoom level %d", pano.id, zoom)
+        return None
+    return _stitch_tiles(tile_images, tiles, img_size[0], img_size[1], Size(512, 512))
+
+async def _find_highest_zoom_async(panoid: str, max_zoom: int = _MAX_ZOOM) -> Optional[int]:
+    """
+    Async version of :func:`_find_highest_zoom`. Rather than probing zoom levels
+    one at a time, all of them are probed in parallel, so finding the highest
+    zoom costs a single round trip.
+    """
+    cached_zoom = _highest_zoom_cache.get(panoid)
+    if cached_zoom is not None:
+        return min(cached_zoom, max_zoom)
+    if _unavailable_cache.get(panoid):
+        return None
+
+    async def probe(client: httpx.AsyncClient, test_zoom: int) -> bool:
+        try:
+            response = await client.head(_generate_tile_url(panoid, test_zoom, 0, 0),
+                                         timeout=5, follow_redirects=True)
+            return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    zooms = range(max_zoom, -1, -1)
+    async with httpx.AsyncClient(http2=True, limits=_TILE_CLIENT_LIMITS) as client:
+        available = await asyncio.gather(*(probe(client, test_zoom) for test_zoom in zooms))
+    for test_zoom, is_available in zip(zooms, available):
+        if is_available:
+            _highest_zoom_cache.set(panoid, test_zoom)
+            return test_zoom
+    _unavailable_cache.set(panoid, True)
+    return None
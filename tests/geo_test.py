@@ -10,6 +10,15 @@ def test_wgs84_to_tile_coord():
     assert expected == actual
 
 
+def test_wgs84_to_tile_coords():
+    points = [(53.539043721545404, 9.98702908360777),
+              (47.15048822721601, 11.13385612403307)]
+    expected = [(69172, 42368), (69589, 46021)]
+    actual = geo.wgs84_to_tile_coords(points, 17)
+    for (ex, ey), (ax, ay) in zip(expected, actual):
+        assert (ex, ey) == (ax, ay)
+
+
 def tile_coord_to_wgs84():
     expected = (53.54030739150021, 9.986572265625)
     actual = geo.tile_coord_to_wgs84(69172, 42368, 17)
@@ -1,10 +1,37 @@
 from pytest import approx, raises
+import asyncio
 import json
 from streetlevel import streetview
 from streetlevel.dataclasses import Size
 import streetlevel.streetview.parse
 
 
+class FakeCoverageTileResponse:
+    def __init__(self, status, body=""):
+        self.status = status
+        self.headers = {}
+        self._body = body
+
+    async def text(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeCoverageTileSession:
+    def __init__(self, respond):
+        self.requested_urls = []
+        self._respond = respond
+
+    def get(self, url):
+        self.requested_urls.append(url)
+        return self._respond(url)
+
+
 def test_is_third_party_panoid():
     assert not streetview.is_third_party_panoid("n-Zd6bDDL_XOc_jkNgFsGg")
     assert streetview.is_third_party_panoid("AF1QipN3bwjvnpTUbfCZ18wsUMrpZ6Ul2mhVfNKl71_X")
@@ -137,3 +164,33 @@ def test_build_permalink_raises():
         streetview.build_permalink(lat=None, lon=42)
     with raises(ValueError):
         streetview.build_permalink()
+
+
+async def test_get_coverage_tiles_by_latlons():
+    with open("streetview/data/coverage_tile.json", "r") as f:
+        body = ")]}'" + f.read()
+    session = FakeCoverageTileSession(lambda url: FakeCoverageTileResponse(200, body))
+
+    points = [(47.15048822721601, 11.13385612403307),
+              (47.1505, 11.1339),  # falls on the same tile as the point above
+              (53.539043721545404, 9.98702908360777)]
+    panos = await streetview.get_coverage_tiles_by_latlons_async(points, session)
+
+    assert len(session.requested_urls) == 2  # the duplicate tile is only fetched once
+    assert len(panos) == 3
+    assert panos[0] is panos[1]
+    assert any(p.id == "n-Zd6bDDL_XOc_jkNgFsGg" for p in panos[0])
+
+
+async def test_get_coverage_tiles_by_latlons_failed_tile(monkeypatch):
+    async def no_sleep(_delay):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    session = FakeCoverageTileSession(lambda url: FakeCoverageTileResponse(500, "error"))
+
+    panos = await streetview.get_coverage_tiles_by_latlons_async(
+        [(47.15048822721601, 11.13385612403307)], session)
+
+    assert panos == [[]]
+    assert len(session.requested_urls) == 3  # failed fetches are retried